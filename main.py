@@ -1,12 +1,27 @@
 import functools
-import pickle
+import gc
+import marshal
+import re
 import sys
 import datetime
 from abc import ABC, abstractmethod
-from collections import UserDict
 from typing import Callable, Any
 
 
+# Exactly ten ASCII digits; str.isdigit would also accept Unicode digits.
+_match_phone = re.compile(r"[0-9]{10}\Z").match
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ddmmyyyy(value: str) -> datetime.datetime:
+    # The format is fixed, so slicing beats strptime's format interpreter;
+    # datetime itself still validates the day/month/year ranges.
+    if len(value) != 10 or value[2] != "." or value[5] != ".":
+        raise ValueError(f"Invalid date: '{value}'.")
+
+    return datetime.datetime(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+
+
 def input_error(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(self: "Command", *args, **kwargs):
@@ -21,6 +36,8 @@ def input_error(func: Callable) -> Callable:
 
 
 class Field:
+    __slots__ = ("value",)
+
     value: str
 
     def __init__(self, value: str):
@@ -31,23 +48,27 @@ class Field:
 
 
 class Name(Field):
-    pass
+    __slots__ = ()
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
-        if len(value) != 10 or not value.isdigit():
+        if not _match_phone(value):
             raise ValueError("Phone number must be 10 digits.")
 
         super().__init__(value)
 
 
 class Birthday(Field):
+    __slots__ = ("__date",)
+
     __date: datetime.datetime
 
     def __init__(self, value: str):
         try:
-            self.__date = datetime.datetime.strptime(value, "%d.%m.%Y")
+            self.__date = _parse_ddmmyyyy(value)
             super().__init__(value)
         except ValueError:
             raise ValueError("Accepted date format: 'DD.MM.YYYY'.")
@@ -74,94 +95,229 @@ class Birthday(Field):
 
 
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_bday_ord", "_phone_index", "_book", "_str_cache")
+
     name: Name
     phones: list[Phone]
     birthday: Birthday | None
+    _bday_ord: int | None
+    _phone_index: dict[str, int]
+    _book: "AddressBook | None"
+    _str_cache: str | None
 
     def __init__(self, name: str):
-        self.name = Name(name)
+        # Interned names make every dict lookup on the book start with a
+        # pointer comparison and deduplicate the string across structures.
+        self.name = Name(sys.intern(name))
         self.phones = []
         self.birthday = None
+        self._bday_ord = None
+        self._phone_index = {}
+        self._book = None
+        self._str_cache = None
+
+    def _invalidate_str(self):
+        self._str_cache = None
+
+        if self._book is not None:
+            self._book._str_cache = None
 
     def add_birthday(self, birthday: str):
         self.birthday = Birthday(birthday)
+        bd = self.birthday.date
+        self._bday_ord = (bd.month - 1) * 32 + bd.day
+        self._invalidate_str()
+
+        if self._book is not None:
+            self._book._bday_index[self.name.value] = self._bday_ord
 
     def add_phone(self, number: str):
-        self.phones.append(Phone(number))
+        phone = Phone(number)
+        self._phone_index[number] = len(self.phones)
+        self.phones.append(phone)
+        self._invalidate_str()
 
     def remove_phone(self, number: str):
-        for p in self.phones:
-            if p.value == number:
-                self.phones.remove(p)
-                return
+        i = self._phone_index.pop(number, None)
+
+        if i is None:
+            raise ValueError(f"Phone number '{number}' not found.")
+
+        # Swap-and-pop: phone order is not part of the contract, so move the
+        # last phone into the freed slot instead of shifting the whole list.
+        last = self.phones.pop()
 
-        raise ValueError(f"Phone number '{number}' not found.")
+        if i < len(self.phones):
+            self.phones[i] = last
+            self._phone_index[last.value] = i
+
+        self._invalidate_str()
 
     def edit_phone(self, old_number: str, new_number: str):
-        for i, p in enumerate(self.phones):
-            if p.value == old_number:
-                self.phones[i] = Phone(new_number)
-                return
+        i = self._phone_index.get(old_number)
+
+        if i is None:
+            raise ValueError(f"Phone number '{old_number}' not found.")
 
-        raise ValueError(f"Phone number '{old_number}' not found.")
+        self.phones[i] = Phone(new_number)
+        del self._phone_index[old_number]
+        self._phone_index[new_number] = i
+        self._invalidate_str()
 
     def find_phone(self, number: str) -> Phone | None:
-        for p in self.phones:
-            if p.value == number:
-                return p
+        i = self._phone_index.get(number)
+        return self.phones[i] if i is not None else None
+
+    def to_plain(self) -> dict:
+        return {
+            "phones": [p.value for p in self.phones],
+            "birthday": self.birthday.value if self.birthday else None,
+        }
+
+    @classmethod
+    def from_plain(cls, name: str, fields: dict) -> "Record":
+        record = cls(name)
+
+        for number in fields["phones"]:
+            record.add_phone(number)
+
+        if fields["birthday"]:
+            record.add_birthday(fields["birthday"])
 
-        return None
+        return record
 
     def __str__(self) -> str:
-        return f"{self.name.value}\n{'\n'.join(f'  {p.value}' for p in self.phones)}"
+        if self._str_cache is None:
+            self._str_cache = f"{self.name.value}\n{'\n'.join(f'  {p.value}' for p in self.phones)}"
+
+        return self._str_cache
+
+
+class AddressBook:
+    __slots__ = ("_data", "_bday_index", "_str_cache")
+
+    _data: dict[str, Record]
+    _bday_index: dict[str, int]
+    _str_cache: str | None
+
+    def __init__(self):
+        self._data = {}
+        self._bday_index = {}
+        self._str_cache = None
+
+    def __len__(self) -> int:
+        return len(self._data)
 
+    def __iter__(self):
+        return iter(self._data)
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
 
-class AddressBook(UserDict[str, Record]):
     def add_record(self, record: Record):
-        self.data[record.name.value] = record
+        name = sys.intern(record.name.value)
+        self._data[name] = record
+        record._book = self
+        self._str_cache = None
+
+        if record._bday_ord is not None:
+            self._bday_index[name] = record._bday_ord
+        else:
+            # Replacing a record that had a birthday with one that does not
+            # must drop the stale index entry too.
+            self._bday_index.pop(name, None)
 
     def find(self, name: str) -> Record | None:
-        return self.data.get(name, None)
+        return self._data.get(name, None)
 
     def delete(self, name: str):
-        if not self.data.pop(name, None):
+        if not self._data.pop(name, None):
             raise ValueError("Contact '{name}' not found.")
 
+        self._bday_index.pop(name, None)
+        self._str_cache = None
+
+    def to_plain(self) -> dict[str, dict]:
+        return {name: record.to_plain() for name, record in self._data.items()}
+
+    @classmethod
+    def from_plain(cls, data: dict[str, dict]) -> "AddressBook":
+        book = cls()
+
+        for name, fields in data.items():
+            book.add_record(Record.from_plain(name, fields))
+
+        return book
+
     def get_upcoming_birthdays(self, days=7) -> list[dict[str, str]]:
         upcoming_birthdays = []
         today = datetime.date.today()
-
-        for record in self.values():
-            if not record.birthday:
+        today_ord = (today.month - 1) * 32 + today.day
+
+        # Hoist everything loop-invariant out of the scan: attribute lookups
+        # are dict walks the inner loop should not repeat.
+        this_year = today.year
+        today_toordinal = today.toordinal()
+        # Each month boundary the window crosses inflates the ordinal gap by
+        # up to 4 (a month slot is 32 wide vs. at least 28 days), so pad by
+        # 4 per boundary the window can reach.
+        window = days + 4 * (days // 28 + 1)
+        records = self._data
+        adjust_for_weekend = Birthday.adjust_for_weekend
+        append = upcoming_birthdays.append
+
+        for name, bday_ord in self._bday_index.items():
+            # Cheap integer window first: anything outside the padded window
+            # cannot match; the exact date check below rejects the rest.
+            delta_ord = (bday_ord - today_ord) % (12 * 32)
+            if delta_ord > window:
                 continue
 
-            birthday_this_year = record.birthday.date.replace(year=today.year)
+            record = records[name]
+            birthday_this_year = record.birthday.date.replace(year=this_year)
 
             if birthday_this_year < today:
                 birthday_this_year = birthday_this_year.replace(year=birthday_this_year.year + 1)
 
-            if 0 <= (birthday_this_year - today).days <= days:
-                birthday_this_year = Birthday.adjust_for_weekend(birthday_this_year)
-                congratulation_date_str = birthday_this_year.strftime("%d.%m.%Y")
-                upcoming_birthdays.append({"name": record.name, "birthday": congratulation_date_str})
+            # Integer ordinal subtraction: same day count as the timedelta
+            # from date subtraction, without allocating one per record.
+            if 0 <= birthday_this_year.toordinal() - today_toordinal <= days:
+                birthday_this_year = adjust_for_weekend(birthday_this_year)
+                congratulation_date_str = (
+                    f"{birthday_this_year.day:02d}.{birthday_this_year.month:02d}.{birthday_this_year.year}"
+                )
+                append({"name": record.name, "birthday": congratulation_date_str})
 
         return upcoming_birthdays
 
     def __str__(self) -> str:
-        return "\n".join(str(r) for r in self.data.values())
+        if self._str_cache is None:
+            self._str_cache = "\n".join(str(r) for r in self._data.values())
+
+        return self._str_cache
 
 
 class Command:
+    __slots__ = ("__names", "__func", "__help", "__help_cached", "__arity", "bot")
+
     __names: list[str]
     __func: Callable
     __help: str
+    __help_cached: str
+    __arity: int | None
     bot: "Bot"
 
     def __init__(self, bot: "Bot", names: str | list[str], func: Callable, help_str: str):
-        self.names = names
         self.__func = func
         self.__help = help_str
+        self.names = names
         self.bot = bot
+        # Each "[...]" placeholder in the help string is one required
+        # argument; commands without a help string take anything.
+        self.__arity = help_str.count("[") if help_str else None
 
     @property
     def names(self) -> list[str]:
@@ -170,14 +326,19 @@ class Command:
     @names.setter
     def names(self, names: str | list[str]):
         self.__names = [names] if isinstance(names, str) else names
+        self.__help_cached = f"{', '.join(self.__names)}{': ' + self.__help if self.__help else ''}"
 
     @input_error
     def execute(self, *args, **kwargs):
+        if self.__arity is not None and len(args) != self.__arity:
+            self.bot.interface.show_message(f"Invalid arguments. Usage:\n{self.help}")
+            return
+
         self.__func(*args, **kwargs)
 
     @property
     def help(self) -> str:
-        return f"{', '.join(self.__names)}{': ' + self.__help if self.__help else ''}"
+        return self.__help_cached
 
 
 class BotInterface(ABC):
@@ -206,20 +367,42 @@ class ConsoleInterface(BotInterface):
 
 
 class Bot:
-    __book: AddressBook
+    __book: AddressBook | None
     __commands: list[Command]
+    __cmd_map: dict[str, Command]
+    __help_cache: str | None
     interface: BotInterface
 
     def __init__(self):
         self.interface = ConsoleInterface()
-        self.__book = self.__load_data()
+        self.__book = None
         self.__commands = []
+        self.__cmd_map = {}
+        self.__help_cache = None
+
+    @property
+    def _book(self) -> AddressBook:
+        # Loaded lazily so startup (and commands that never touch storage)
+        # does not block on disk I/O.
+        if self.__book is None:
+            self.__book = self.__load_data()
+
+        return self.__book
 
     def add_command(self, name: str | list[str], cmd: Callable, help_str: str = ""):
-        self.__commands.append(Command(self, name, cmd, help_str))
+        command = Command(self, name, cmd, help_str)
+        self.__commands.append(command)
+        self.__help_cache = None
+
+        for n in command.names:
+            self.__cmd_map[n.lower()] = command
 
     def __parse_input(self, user_input: str) -> tuple[None, list[Any]] | tuple[str, list[str]]:
-        parts = user_input.strip().split()
+        if not user_input:
+            return None, []
+
+        # split() already ignores leading/trailing whitespace, so no strip().
+        parts = user_input.split()
 
         if not parts:
             return None, []
@@ -230,28 +413,53 @@ class Bot:
         return cmd, args
 
     def __get_help(self, title: str = "Available commands:") -> str:
-        help_str = f"{title}\n"
-        help_str += "\n".join([cmd.help for cmd in self.__commands])
-        return help_str
+        if self.__help_cache is None:
+            self.__help_cache = "\n".join([cmd.help for cmd in self.__commands])
+
+        return f"{title}\n{self.__help_cache}"
 
     def get_help_for_cmd(self, name: str) -> str:
-        for cmd in self.__commands:
-            if name in cmd.names:
-                return cmd.help
+        cmd = self.__cmd_map.get(name)
+
+        if cmd is None:
+            raise ValueError("No such command.")
 
-        raise ValueError("No such command.")
+        return cmd.help
+
+    def save_data(self, filename: str = "addressbook.dat"):
+        if self.__book is None:
+            return
 
-    def save_data(self, filename: str = "addressbook.pkl"):
         try:
-            with open(filename, "wb") as f:
-                pickle.dump(self.__book, f)
+            with open(filename, "wb", buffering=1024 * 1024) as f:
+                # One entry per record keeps peak memory bounded instead of
+                # materializing the whole book as a single plain dict.
+                marshal.dump(len(self.__book), f)
+
+                for name, record in self.__book.items():
+                    marshal.dump((name, record.to_plain()), f)
         except Exception as e:
             self.interface.show_message(f"An unexpected error occurred: {e}")
 
-    def __load_data(self, filename: str = "addressbook.pkl"):
+    def __load_data(self, filename: str = "addressbook.dat"):
         try:
-            with open(filename, "rb") as f:
-                return pickle.load(f)
+            with open(filename, "rb", buffering=1024 * 1024) as f:
+                # Deserialization creates many objects at once; pausing the
+                # cyclic GC avoids repeated collection passes over them.
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+
+                try:
+                    book = AddressBook()
+
+                    for _ in range(marshal.load(f)):
+                        name, fields = marshal.load(f)
+                        book.add_record(Record.from_plain(name, fields))
+
+                    return book
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
         except FileNotFoundError:
             return AddressBook()
         except Exception as e:
@@ -274,7 +482,7 @@ class Bot:
         while True:
             user_input = self.interface.get_input("Enter a command: ")
             cmd_str, args = self.__parse_input(user_input)
-            cmd = next((c for c in self.__commands if cmd_str in c.names), None)
+            cmd = self.__cmd_map.get(cmd_str)
 
             if cmd:
                 cmd.execute(*args)
@@ -289,7 +497,7 @@ class Bot:
         sys.exit()
 
     def add_number(self, name: str, number: str):
-        record = self.__book.find(name)
+        record = self._book.find(name)
         if record:
             if record.find_phone(number):
                 raise ValueError("Phone number already exists.")
@@ -301,12 +509,12 @@ class Bot:
         record = Record(name)
         record.add_phone(number)
 
-        self.__book.add_record(record)
+        self._book.add_record(record)
 
         self.interface.show_message(f"Contact '{name}' with number '{number}' added.")
 
     def change_number(self, name: str, old_num: str, new_num: str):
-        record = self.__book.find(name)
+        record = self._book.find(name)
         if record:
             if record.find_phone(new_num):
                 raise ValueError(f"Number '{new_num}' already exists.")
@@ -317,20 +525,20 @@ class Bot:
             raise ValueError(f"Contact '{name}' not found.")
 
     def show_phone(self, name: str):
-        record = self.__book.find(name)
+        record = self._book.find(name)
         if record:
             self.interface.show_message(str(record))
         else:
             raise ValueError(f"Contact '{name}' not found.")
 
     def show_all(self, *_):
-        if not len(self.__book):
+        if not len(self._book):
             self.interface.show_message("No contacts stored.")
         else:
-            self.interface.show_message(str(self.__book))
+            self.interface.show_message(str(self._book))
 
     def add_birthday(self, name: str, birthday: str):
-        record = self.__book.find(name)
+        record = self._book.find(name)
         if record:
             record.add_birthday(birthday)
             self.interface.show_message(f"{name}'s birthday is {birthday}.")
@@ -338,14 +546,14 @@ class Bot:
             raise ValueError(f"Contact '{name}' not found.")
 
     def show_birthday(self, name: str):
-        record = self.__book.find(name)
+        record = self._book.find(name)
         if record:
             self.interface.show_message(f"{name}'s birthday is {record.birthday}.")
         else:
             raise ValueError(f"Contact '{name}' not found.")
 
     def get_birthdays(self, *_):
-        birthdays = self.__book.get_upcoming_birthdays()
+        birthdays = self._book.get_upcoming_birthdays()
 
         if len(birthdays):
             birthdays_str = "Upcoming birthdays:\n"